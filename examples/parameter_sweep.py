@@ -1,24 +1,68 @@
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from src.core.vortex_generator import VortexGenerator
-from src.visualization.plotter_3d import plot_vortex
-from src.visualization.export_utils import save_image
+from src.visualization.plotter_3d import plot_vortex_3d
+from src.visualization.export_utils import save_as_image
+from src.utils.work_queue import WorkQueue, run_worker
 
-def parameter_sweep(m_values, k_values, t_values):
+def run_sweep_point(m, k, t, output_dir="output/images"):
+    print(f"Running simulation for m={m}, k={k}, t={t}...")
+
+    r = np.linspace(0.5, 10, 30)
+    theta = np.linspace(0, 2 * np.pi, 60)
+    R, THETA = np.meshgrid(r, theta)
+    Z = np.full_like(R, 5.0)
+
+    vortex_gen = VortexGenerator(m, k, t)
+    vortex_structure = vortex_gen.generate_vortex_structure(R, THETA, Z)
+
+    X = R * np.cos(THETA)
+    Y = R * np.sin(THETA)
+    fig = plot_vortex_3d(X, Y, Z + vortex_structure, title=f"Vortex m={m}, k={k}, t={t}")
+    save_as_image(fig, os.path.join(output_dir, f"vortex_m{m}_k{k}_t{t}.png"))
+    plt.close(fig)
+
+def run_sweep_task(payload):
+    run_sweep_point(payload['m'], payload['k'], payload['t'], payload['output_dir'])
+
+def enqueue_parameter_sweep(queue, m_values, k_values, t_values, output_dir="output/images"):
+    task_ids = []
     for m in m_values:
         for k in k_values:
             for t in t_values:
-                print(f"Running simulation for m={m}, k={k}, t={t}...")
-                
-                vortex_gen = VortexGenerator(m, k, t)
-                vortex_structure = vortex_gen.generate_vortex_structure()
-                
-                plot_vortex(vortex_structure)
-                save_image(f"output/images/vortex_m{m}_k{k}_t{t}.png")
+                task_id = f"sweep_m{m}_k{k}_t{t}"
+                queue.put(task_id, {'m': m, 'k': k, 't': t, 'output_dir': output_dir}, retry_failed=True)
+                task_ids.append(task_id)
+    return task_ids
+
+def parameter_sweep(m_values, k_values, t_values, queue_dir=None, output_dir="output/images"):
+    """Run every sweep point; returns the task ids that failed in queue mode."""
+    if queue_dir is None:
+        for m in m_values:
+            for k in k_values:
+                for t in t_values:
+                    run_sweep_point(m, k, t, output_dir)
+        return []
+
+    # Every node runs the same command; tasks already queued are skipped and
+    # failed ones are retried
+    queue = WorkQueue(queue_dir)
+    task_ids = enqueue_parameter_sweep(queue, m_values, k_values, t_values, output_dir)
+    run_worker(queue, run_sweep_task, prefix='sweep_')
+
+    failed = [task_id for task_id in queue.failed_ids() if task_id in task_ids]
+    if failed:
+        print(f"{len(failed)} sweep points failed, see {queue_dir}/failed")
+    return failed
 
 if __name__ == "__main__":
     m_values = [1, 2, 3, 4]
-    k_values = [0.1, 0.2, 0.3]
+    k_values = [1, 2, 3]  # number of Fourier harmonics
     t_values = [0, 1, 2]
 
-    parameter_sweep(m_values, k_values, t_values)
\ No newline at end of file
+    # python examples/parameter_sweep.py /shared/queue  -> distributed mode
+    queue_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    if parameter_sweep(m_values, k_values, t_values, queue_dir):
+        sys.exit(1)
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import math
+
+from .parameters import (
+    DEFAULT_MODE_M,
+    DEFAULT_N_FOURIER_MODES,
+    DEFAULT_N_LAYERS,
+    DEFAULT_LAYER_SPACING,
+    DEFAULT_EXP_DECAY_RATE,
+)
+
+try:
+    from ..utils.file_handlers import read_config_file
+except ImportError:  # core/ and utils/ installed as top-level packages
+    from utils.file_handlers import read_config_file
+
+# (name, kind, default) for every setting a simulation can be run with
+FIELDS = (
+    ('mode_m', int, DEFAULT_MODE_M),
+    ('n_fourier_modes', int, DEFAULT_N_FOURIER_MODES),
+    ('n_layers', int, DEFAULT_N_LAYERS),
+    ('layer_spacing', float, DEFAULT_LAYER_SPACING),
+    ('exp_decay_rate', float, DEFAULT_EXP_DECAY_RATE),
+    ('time_steps', int, 100),
+    ('theta_steps', int, 60),
+    ('r_min', float, 0.5),
+    ('r_max', float, 10.0),
+    ('z_value', float, 5.0),
+    ('output_format', tuple, ('png',)),
+    ('animation_fps', int, 30),
+    ('video_duration', float, 10.0),
+    ('colormap', str, 'coolwarm'),
+    ('surface_alpha', float, 0.7),
+    ('save_directory', str, 'output/animations'),
+    ('k_wave', float, 0.5),
+    ('z_max', float, 20.0),
+    ('n_r', int, 40),
+    ('n_z', int, 30),
+    ('gamma', float, 10.0),
+    ('sigma', float, 0.1),
+    ('rho', float, 1.0),
+    ('core_radius', float, 1.0),
+    ('save_frames', bool, True),
+)
+
+# Alternative spellings found in the config files and simulators
+ALIASES = {
+    'modo_m': 'mode_m',
+    'm_mode': 'mode_m',
+    'fps': 'animation_fps',
+    'duration': 'video_duration',
+    'n_theta': 'theta_steps',
+}
+
+# Nested sections of simulation_config.yaml that are flattened on load
+SECTIONS = ('simulation_parameters', 'animation_settings', 'visualization')
+
+_FIELD_NAMES = tuple(name for name, _, _ in FIELDS)
+_FIELD_KINDS = {name: kind for name, kind, _ in FIELDS}
+
+
+def _coerce(name, value):
+    kind = _FIELD_KINDS[name]
+    if kind is int:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not float(value).is_integer():
+            raise ValueError(f"{name} must be an integer, got {value!r}")
+        return int(value)
+    if kind is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ValueError(f"{name} must be a finite number, got {value!r}")
+        return float(value)
+    if kind is bool:
+        if not isinstance(value, bool):
+            raise ValueError(f"{name} must be true or false, got {value!r}")
+        return value
+    if kind is tuple:
+        if isinstance(value, str):
+            values = (value,)
+        elif isinstance(value, (list, tuple)):
+            values = tuple(value)
+        else:
+            raise ValueError(f"{name} must be a string or a list of strings, got {value!r}")
+        if not values or not all(isinstance(v, str) and v for v in values):
+            raise ValueError(f"{name} must be a non-empty list of strings, got {value!r}")
+        return tuple(sorted(set(v.lower() for v in values)))
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"{name} must be a non-empty string, got {value!r}")
+    return value
+
+
+def _check_ranges(values):
+    if values['mode_m'] < 0:
+        raise ValueError("mode_m must be >= 0")
+    for name in ('n_fourier_modes', 'n_layers', 'time_steps', 'animation_fps', 'n_z'):
+        if values[name] < 1:
+            raise ValueError(f"{name} must be >= 1")
+    for name in ('theta_steps', 'n_r'):
+        if values[name] < 2:
+            raise ValueError(f"{name} must be >= 2")
+    for name in ('layer_spacing', 'video_duration', 'z_max', 'rho', 'core_radius'):
+        if values[name] <= 0:
+            raise ValueError(f"{name} must be > 0")
+    for name in ('exp_decay_rate', 'sigma'):
+        if values[name] < 0:
+            raise ValueError(f"{name} must be >= 0")
+    if not 0 <= values['r_min'] < values['r_max']:
+        raise ValueError("expected 0 <= r_min < r_max")
+    if not 0 <= values['surface_alpha'] <= 1:
+        raise ValueError("surface_alpha must be between 0 and 1")
+
+
+def canonical_key(key):
+    return ALIASES.get(key, key)
+
+
+def _flatten(data, flat):
+    for key, value in data.items():
+        if key in SECTIONS and isinstance(value, dict):
+            _flatten(value, flat)
+            continue
+        name = canonical_key(key)
+        if name in flat and flat[name] != value:
+            raise ValueError(f"Conflicting values for {name}: {flat[name]!r} and {value!r}")
+        flat[name] = value
+
+
+def _rebuild(cls, values):
+    return cls(**values)
+
+
+class SimulationConfig:
+    """Immutable, validated set of simulation parameters.
+
+    Equal configurations always have the same ``canonical_hash`` no matter
+    which file format or key spelling they were loaded from.
+    """
+
+    __slots__ = _FIELD_NAMES + ('_hash',)
+
+    def __init__(self, **params):
+        unknown = set(params) - set(_FIELD_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+        values = {}
+        for name, _, default in FIELDS:
+            values[name] = _coerce(name, params.get(name, default))
+        _check_ranges(values)
+
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+        payload = json.dumps(values, sort_keys=True, separators=(',', ':'))
+        object.__setattr__(self, '_hash', hashlib.sha256(payload.encode('utf-8')).hexdigest())
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a config from a flat or sectioned dict, resolving key aliases."""
+        flat = {}
+        _flatten(data, flat)
+        return cls(**flat)
+
+    @classmethod
+    def from_file(cls, file_path):
+        return cls.from_dict(read_config_file(file_path) or {})
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+    def replace(self, **changes):
+        """Return a copy with ``changes`` applied; accepts the same keys as from_dict."""
+        flat = {}
+        _flatten(changes, flat)
+        values = self.to_dict()
+        values.update(flat)
+        return self.__class__(**values)
+
+    @property
+    def canonical_hash(self):
+        return self._hash
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, SimulationConfig):
+            return NotImplemented
+        return self._hash == other._hash
+
+    def __hash__(self):
+        return int(self._hash[:16], 16)
+
+    def __reduce__(self):
+        return _rebuild, (self.__class__, self.to_dict())
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in _FIELD_NAMES)
+        return f"{self.__class__.__name__}({fields})"
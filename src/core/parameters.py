@@ -1,26 +1,33 @@
 # File: /vortex-simulator/vortex-simulator/src/core/parameters.py
 
+try:
+    from ..utils.file_handlers import read_json_file, read_yaml_file
+except ImportError:  # core/ and utils/ installed as top-level packages
+    from utils.file_handlers import read_json_file, read_yaml_file
+
 DEFAULT_MODE_M = 4
 DEFAULT_N_FOURIER_MODES = 4
 DEFAULT_N_LAYERS = 4
 DEFAULT_LAYER_SPACING = 3.0
 DEFAULT_EXP_DECAY_RATE = 0.5
 
+# The loaders below return validated dicts with canonical key names; see
+# core.config.SimulationConfig (imported lazily, it depends on the defaults above)
+
 def load_parameters_from_json(file_path):
-    import json
-    with open(file_path, 'r') as file:
-        return json.load(file)
+    from .config import SimulationConfig
+    return SimulationConfig.from_dict(read_json_file(file_path) or {}).to_dict()
 
 def load_parameters_from_yaml(file_path):
-    import yaml
-    with open(file_path, 'r') as file:
-        return yaml.safe_load(file)
+    from .config import SimulationConfig
+    return SimulationConfig.from_dict(read_yaml_file(file_path) or {}).to_dict()
 
 def get_default_parameters():
-    return {
-        'mode_m': DEFAULT_MODE_M,
-        'n_fourier_modes': DEFAULT_N_FOURIER_MODES,
-        'n_layers': DEFAULT_N_LAYERS,
-        'layer_spacing': DEFAULT_LAYER_SPACING,
-        'exp_decay_rate': DEFAULT_EXP_DECAY_RATE
-    }
\ No newline at end of file
+    return load_config().to_dict()
+
+def load_config(file_path=None):
+    """Load a SimulationConfig, picking JSON or YAML by file extension."""
+    from .config import SimulationConfig
+    if file_path is None:
+        return SimulationConfig()
+    return SimulationConfig.from_file(file_path)
@@ -1,29 +1,52 @@
+import numpy as np
+
+try:
+    from ..utils.math_helpers import harmonic_exponentials
+except ImportError:  # core/, utils/ and visualization/ installed as top-level packages
+    from utils.math_helpers import harmonic_exponentials
+
 class VortexGenerator:
     def __init__(self, m, k, t, exp_decay_rate=0.5):
+        # k is the number of Fourier harmonics summed by generate_vortex_structure
+        if m < 0:
+            raise ValueError(f"m must be >= 0, got {m!r}")
+        if k < 1 or float(k) != int(k):
+            raise ValueError(f"k must be a positive integer, got {k!r}")
         self.m = m
-        self.k = k
+        self.k = int(k)
         self.t = t
         self.exp_decay_rate = exp_decay_rate
 
-    def wave_function(self, r, theta, z):
-        amplitude_n = 1.0 / (self.k ** 0.5)
-        gamma_n = self.exp_decay_rate * self.k / 10
-        alpha_n = self.exp_decay_rate * self.k / 15
-        omega_n = 1.2 * (1 + 0.2 * self.k)
-        k_n = 0.4 * self.k / 2
+    def wave_function(self, r, theta, z, n=None):
+        """Harmonic n of the vortex (defaults to the highest one, n = k)."""
+        n = self.k if n is None else n
+        amplitude_n = 1.0 / (n ** 0.5)
+        gamma_n = self.exp_decay_rate * n / 10
+        alpha_n = self.exp_decay_rate * n / 15
+        omega_n = 1.2 * (1 + 0.2 * n)
+        k_n = 0.4 * n / 2
 
         exp_radial = np.exp(-gamma_n * r)
         exp_vertical = np.exp(-alpha_n * z)
 
-        return amplitude_n * exp_radial * exp_vertical * np.cos(self.k * self.m * theta + k_n * z - omega_n * self.t)
+        return amplitude_n * exp_radial * exp_vertical * np.cos(n * self.m * theta + k_n * z - omega_n * self.t)
 
     def generate_vortex_structure(self, r, theta, z):
-        vortex_structure = np.zeros_like(r)
+        r, theta, z = (np.asarray(a, dtype=float) for a in (r, theta, z))
+
+        # Harmonic n is amplitude_n * envelope**n * Re(e^{-1.2it} * e^{in*base_phase}),
+        # so both the decay and the phase follow from the n = 1 terms by multiplication
+        base_phase = self.m * theta + 0.2 * z - 0.24 * self.t
+        base_envelope = np.exp(-self.exp_decay_rate * (r / 10 + z / 15))
+        envelope = np.ones(np.broadcast(r, theta, z).shape)
+        vortex_structure = np.zeros(envelope.shape, dtype=complex)
 
-        for n in range(1, self.k + 1):
-            vortex_structure += self.wave_function(r, theta, z)
+        harmonics = harmonic_exponentials(base_phase, self.k, reuse_buffer=True)
+        for n, harmonic in enumerate(harmonics, start=1):
+            envelope *= base_envelope
+            vortex_structure += (1.0 / n ** 0.5) * envelope * harmonic
 
-        return vortex_structure
+        return (np.exp(-1.2j * self.t) * vortex_structure).real
 
     def export_results(self, results, filename):
         np.save(filename, results)  # Save results as a .npy file
@@ -1,19 +1,30 @@
+import json
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
 def read_json_file(file_path):
-    import json
     with open(file_path, 'r') as file:
         return json.load(file)
 
 def write_json_file(file_path, data):
-    import json
     with open(file_path, 'w') as file:
         json.dump(data, file, indent=4)
 
 def read_yaml_file(file_path):
-    import yaml
     with open(file_path, 'r') as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=YamlLoader)
 
 def write_yaml_file(file_path, data):
-    import yaml
     with open(file_path, 'w') as file:
-        yaml.dump(data, file)
\ No newline at end of file
+        yaml.dump(data, file, Dumper=YamlDumper)
+
+def read_config_file(file_path):
+    if str(file_path).endswith(('.yaml', '.yml')):
+        return read_yaml_file(file_path)
+    return read_json_file(file_path)
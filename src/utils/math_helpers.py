@@ -1,3 +1,5 @@
+import numpy as np
+
 def calculate_wave_function(m, k, t, theta, z):
     return np.sin(m * theta) * np.exp(-k * z) * np.cos(t)
 
@@ -12,4 +14,39 @@ def compute_vortex_parameters(m, k, t):
         'wave_function': calculate_wave_function(m, k, t, np.linspace(0, 2 * np.pi, 100), 0),
         'amplitude': 1.0 / (m + 1),
         'frequency': k * m
-    }
\ No newline at end of file
+    }
+
+def harmonic_exponentials(phase, n_harmonics, renormalize_every=16, tol=None, reuse_buffer=False):
+    """Yield exp(1j * n * phase) for n = 1..n_harmonics.
+
+    Only the first harmonic is evaluated with np.exp; the rest follow from
+    z_n = z_{n-1} * z_1. Every ``renormalize_every`` steps z_n is rescaled to
+    unit modulus to stop rounding drift. If ``tol`` is given, z_n is instead
+    compared against direct evaluation every min(renormalize_every,
+    n_harmonics) steps and at the last harmonic; FloatingPointError is raised
+    when the error exceeds ``tol``, otherwise the series continues from the
+    exact value.
+
+    Each harmonic is yielded as a new array. With ``reuse_buffer`` the same
+    array is updated in place and yielded every time, which saves an
+    allocation per harmonic for callers that consume it immediately.
+    """
+    if renormalize_every < 1:
+        raise ValueError("renormalize_every must be >= 1")
+    check_every = min(renormalize_every, max(n_harmonics, 1))
+    phase = np.asarray(phase, dtype=float)
+    base = np.exp(1j * phase)
+    z = np.array(base, dtype=complex)
+    for n in range(1, n_harmonics + 1):
+        if n > 1:
+            np.multiply(z, base, out=z)
+            if tol is not None:
+                if n % check_every == 0 or n == n_harmonics:
+                    exact = np.exp(1j * n * phase)
+                    error = np.max(np.abs(z - exact), initial=0.0)
+                    if error > tol:
+                        raise FloatingPointError(f"Harmonic {n} drifted by {error:.3g} (tol={tol:.3g})")
+                    z[...] = exact
+            elif n % renormalize_every == 0:
+                z /= np.abs(z)
+        yield z if reuse_buffer else z.copy()
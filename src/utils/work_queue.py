@@ -0,0 +1,235 @@
+"""File-based work queue for spreading sweeps and renders across nodes.
+
+The queue is a directory on a shared filesystem::
+
+    pending/<task_id>.json              waiting to be claimed
+    claimed/<task_id>@<worker_id>.json  owned by a worker while its lease holds
+    done/<task_id>.json                 result of a finished task
+    failed/<task_id>.json               error of a task whose handler raised
+
+Tasks are claimed with an atomic ``os.rename`` out of ``pending/``, so only
+one worker wins each task. The claim file's mtime is the lease: workers
+refresh it while they run, and any worker may move claims older than
+``lease_timeout`` back to ``pending/`` so tasks of dead workers get retried.
+Keep ``lease_timeout`` well above the clock skew between nodes.
+
+Different kinds of jobs can share one directory: give their task ids a
+common prefix and pass it to ``run_worker`` so each worker only takes
+tasks its handler understands.
+"""
+
+import json
+import os
+import re
+import socket
+import threading
+import time
+import traceback
+import uuid
+
+_TASK_ID = re.compile(r'^[A-Za-z0-9_.-]+$')
+STATES = ('pending', 'claimed', 'done', 'failed')
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}".replace('@', '_')
+
+
+def split_range(n_items, chunk_size):
+    """Split ``range(n_items)`` into ``(start, stop)`` chunks of ``chunk_size``."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    return [(start, min(start + chunk_size, n_items)) for start in range(0, n_items, chunk_size)]
+
+
+class Task:
+    __slots__ = ('task_id', 'payload', 'worker_id', 'path')
+
+    def __init__(self, task_id, payload, worker_id, path):
+        self.task_id = task_id
+        self.payload = payload
+        self.worker_id = worker_id
+        self.path = path
+
+    def __repr__(self):
+        return f"Task({self.task_id!r}, worker_id={self.worker_id!r})"
+
+
+class WorkQueue:
+    def __init__(self, root, lease_timeout=300.0):
+        self.root = root
+        self.lease_timeout = lease_timeout
+        for state in STATES + ('tmp',):
+            os.makedirs(os.path.join(root, state), exist_ok=True)
+
+    def _path(self, state, name):
+        return os.path.join(self.root, state, name)
+
+    def _write_atomic(self, path, data):
+        tmp_path = self._path('tmp', uuid.uuid4().hex)
+        with open(tmp_path, 'w') as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
+
+    def _claims(self):
+        for name in os.listdir(os.path.join(self.root, 'claimed')):
+            if name.endswith('.json') and '@' in name:
+                task_id, worker_id = name[:-len('.json')].split('@', 1)
+                yield task_id, worker_id, self._path('claimed', name)
+
+    def exists(self, task_id):
+        if any(os.path.exists(self._path(state, f"{task_id}.json")) for state in ('pending', 'done', 'failed')):
+            return True
+        return any(claimed_id == task_id for claimed_id, _, _ in self._claims())
+
+    def put(self, task_id, payload, retry_failed=False):
+        """Add a task; returns False if a task with this id is already known.
+
+        With ``retry_failed`` a previously failed task is enqueued again.
+        """
+        if not _TASK_ID.match(task_id):
+            raise ValueError(f"Invalid task id: {task_id!r}")
+        if retry_failed:
+            try:
+                os.remove(self._path('failed', f"{task_id}.json"))
+            except FileNotFoundError:
+                pass
+        if self.exists(task_id):
+            return False
+        self._write_atomic(self._path('pending', f"{task_id}.json"), payload)
+        return True
+
+    def claim(self, worker_id, prefix=''):
+        """Claim the next pending task whose id starts with ``prefix``, or return None."""
+        for name in sorted(os.listdir(os.path.join(self.root, 'pending'))):
+            if not name.endswith('.json') or not name.startswith(prefix):
+                continue
+            task_id = name[:-len('.json')]
+            source = self._path('pending', name)
+            target = self._path('claimed', f"{task_id}@{worker_id}.json")
+            try:
+                # Refresh mtime first so the lease starts now, not at enqueue time
+                os.utime(source)
+                os.rename(source, target)
+            except FileNotFoundError:
+                continue  # another worker got there first
+            if os.path.exists(self._path('done', name)):
+                os.remove(target)  # requeued after a slow worker already finished it
+                continue
+            with open(target, 'r') as file:
+                payload = json.load(file)
+            return Task(task_id, payload, worker_id, target)
+        return None
+
+    def heartbeat(self, task):
+        """Extend the lease; returns False if the task was taken away."""
+        try:
+            os.utime(task.path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _finish(self, task, state, data):
+        self._write_atomic(self._path(state, f"{task.task_id}.json"), data)
+        try:
+            os.remove(task.path)
+        except FileNotFoundError:
+            pass
+
+    def complete(self, task, result=None):
+        self._finish(task, 'done', {'worker_id': task.worker_id, 'result': result})
+
+    def fail(self, task, error):
+        self._finish(task, 'failed', {'worker_id': task.worker_id, 'payload': task.payload, 'error': error})
+
+    def requeue_expired(self, now=None):
+        """Move claims whose lease ran out back to pending; returns how many."""
+        now = time.time() if now is None else now
+        requeued = 0
+        for task_id, _, path in self._claims():
+            try:
+                if now - os.path.getmtime(path) <= self.lease_timeout:
+                    continue
+                os.rename(path, self._path('pending', f"{task_id}.json"))
+            except FileNotFoundError:
+                continue
+            requeued += 1
+        return requeued
+
+    def was_claimed_once(self, name):
+        return os.path.exists(os.path.join(self.root, f"{name}.once"))
+
+    def claim_once(self, name):
+        """Return True for exactly one caller per ``name``, e.g. to pick who assembles results."""
+        try:
+            fd = os.open(os.path.join(self.root, f"{name}.once"), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+    def is_done(self, task_id):
+        return os.path.exists(self._path('done', f"{task_id}.json"))
+
+    def failed_ids(self):
+        names = os.listdir(os.path.join(self.root, 'failed'))
+        return sorted(name[:-len('.json')] for name in names if name.endswith('.json'))
+
+    def counts(self, prefix=''):
+        counts = {}
+        for state in STATES:
+            names = os.listdir(os.path.join(self.root, state))
+            counts[state] = sum(1 for name in names if name.endswith('.json') and name.startswith(prefix))
+        return counts
+
+    def is_drained(self, prefix=''):
+        counts = self.counts(prefix)
+        return counts['pending'] == 0 and counts['claimed'] == 0
+
+    def results(self):
+        results = {}
+        for name in os.listdir(os.path.join(self.root, 'done')):
+            if name.endswith('.json'):
+                with open(self._path('done', name), 'r') as file:
+                    results[name[:-len('.json')]] = json.load(file)['result']
+        return results
+
+
+def _keep_alive(queue, task, stop):
+    while not stop.wait(queue.lease_timeout / 3):
+        if not queue.heartbeat(task):
+            return
+
+
+def run_worker(queue, handler, worker_id=None, poll_interval=1.0, max_tasks=None, prefix=''):
+    """Drain ``queue`` by calling ``handler(payload)`` for each claimed task.
+
+    Only tasks whose id starts with ``prefix`` are taken. Returns the number
+    of tasks handled once none of those are pending or leased.
+    """
+    worker_id = worker_id or default_worker_id()
+    handled = 0
+    while max_tasks is None or handled < max_tasks:
+        task = queue.claim(worker_id, prefix)
+        if task is None:
+            if queue.requeue_expired():
+                continue
+            if queue.is_drained(prefix):
+                break
+            time.sleep(poll_interval)
+            continue
+
+        stop = threading.Event()
+        keeper = threading.Thread(target=_keep_alive, args=(queue, task, stop), daemon=True)
+        keeper.start()
+        try:
+            result = handler(task.payload)
+        except Exception:
+            queue.fail(task, traceback.format_exc())
+        else:
+            queue.complete(task, result)
+        finally:
+            stop.set()
+            keeper.join()
+        handled += 1
+    return handled
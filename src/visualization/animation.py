@@ -2,6 +2,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib import cm
+try:
+    from ..utils.math_helpers import harmonic_exponentials
+except ImportError:  # core/, utils/ and visualization/ installed as top-level packages
+    from utils.math_helpers import harmonic_exponentials
 
 def create_vortex_animation(r, theta, z, t_values, m, k, output_file, fps=30):
     fig = plt.figure(figsize=(10, 8))
@@ -24,16 +28,14 @@ def create_vortex_animation(r, theta, z, t_values, m, k, output_file, fps=30):
     ani.save(output_file, writer='ffmpeg', fps=fps)
     plt.close(fig)
 
-def generate_fourier_modes(r, theta, z, t, m, k):
-    fourier_sum = np.zeros_like(r)
-    n_fourier_modes = 4  # Example value, can be parameterized
+def generate_fourier_modes(r, theta, z, t, m, k, n_fourier_modes=4, tol=None):
+    # n*m*theta + k_n*z - omega_n*t == n*base_phase - 1.2*t, since k_n and omega_n are linear in n
+    base_phase = m * theta + k * z / 2 - 0.24 * t
+    fourier_sum = np.zeros(np.shape(base_phase), dtype=complex)
+    harmonics = harmonic_exponentials(base_phase, n_fourier_modes, tol=tol, reuse_buffer=True)
 
-    for n in range(1, n_fourier_modes + 1):
+    for n, harmonic in enumerate(harmonics, start=1):
         amplitude_n = 1.0 / n**0.5
-        omega_n = 1.2 * (1 + 0.2 * n)
-        k_n = k * n / 2
-        
-        fourier_term = amplitude_n * np.cos(n * m * theta + k_n * z - omega_n * t)
-        fourier_sum += fourier_term
+        fourier_sum += amplitude_n * harmonic
     
-    return fourier_sum
\ No newline at end of file
+    return (np.exp(-1.2j * t) * fourier_sum).real
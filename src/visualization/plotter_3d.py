@@ -15,4 +15,5 @@ def plot_vortex_3d(X, Y, Z, title="Vortex Structure", cmap='coolwarm', save_path
         plt.savefig(save_path, dpi=150)
         print(f"Plot saved as {save_path}")
     
-    plt.show()
\ No newline at end of file
+    plt.show()    
+    return fig
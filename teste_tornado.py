@@ -13,51 +13,80 @@ import matplotlib.pyplot as plt
 from matplotlib import cm
 from matplotlib.colors import LinearSegmentedColormap
 from mpl_toolkits.mplot3d import Axes3D
-import json
+import os
 from datetime import datetime
+from types import MappingProxyType
+from src.core.config import SimulationConfig
+from src.utils.file_handlers import read_config_file
+from src.utils.work_queue import WorkQueue, default_worker_id, run_worker, split_range
 
 class TornadoSimulator:
-    def __init__(self, config_file=None):
-        """Initialize tornado simulator with physics parameters"""
-        self.load_config(config_file)
+    def __init__(self, config_file=None, config=None):
+        """Initialize tornado simulator from a config file or a SimulationConfig"""
+        if config is None:
+            self.load_config(config_file)
+        else:
+            self.set_config(config)
         self.setup_colormap()
     
+    # Default parameters, validated and canonicalized through SimulationConfig
+    DEFAULT_PARAMS = {
+        # Physical parameters
+        'gamma': 10.0,          # Circulation strength (Γ)
+        'sigma': 0.1,           # Surface tension (σ)
+        'rho': 1.0,             # Density (ρ)
+        'a': 1.0,               # Characteristic radius
+        
+        # Wave parameters
+        'm_mode': 4,            # Azimuthal mode number
+        'k_wave': 0.5,          # Axial wave number
+        'n_fourier_modes': 6,   # Number of Fourier modes
+        'n_layers': 8,          # Number of vertical layers
+        
+        # Simulation parameters
+        'r_max': 15.0,          # Maximum radius
+        'z_max': 20.0,          # Maximum height
+        'n_r': 40,              # Radial resolution
+        'n_theta': 80,          # Angular resolution
+        'n_z': 30,              # Vertical resolution
+        
+        # Animation parameters
+        'fps': 20,
+        'duration': 3.0,        # seconds
+        'save_frames': True
+    }
+    
+    # Canonical SimulationConfig names that this simulator spells differently
+    PARAM_NAMES = {
+        'mode_m': 'm_mode',
+        'core_radius': 'a',
+        'theta_steps': 'n_theta',
+        'animation_fps': 'fps',
+        'video_duration': 'duration',
+    }
+    
+    def config_keys(self, params):
+        """Translate this simulator's parameter names to SimulationConfig names"""
+        config_names = {name: canonical for canonical, name in self.PARAM_NAMES.items()}
+        return {config_names.get(key, key): value for key, value in params.items()}
+    
     def load_config(self, config_file):
-        """Load simulation parameters"""
-        # Default parameters
-        self.params = {
-            # Physical parameters
-            'gamma': 10.0,          # Circulation strength (Γ)
-            'sigma': 0.1,           # Surface tension (σ)
-            'rho': 1.0,             # Density (ρ)
-            'a': 1.0,               # Characteristic radius
-            
-            # Wave parameters
-            'm_mode': 4,            # Azimuthal mode number
-            'k_wave': 0.5,          # Axial wave number
-            'n_fourier_modes': 6,   # Number of Fourier modes
-            'n_layers': 8,          # Number of vertical layers
-            
-            # Simulation parameters
-            'r_max': 15.0,          # Maximum radius
-            'z_max': 20.0,          # Maximum height
-            'n_r': 40,              # Radial resolution
-            'n_theta': 80,          # Angular resolution
-            'n_z': 30,              # Vertical resolution
-            
-            # Animation parameters
-            'fps': 20,
-            'duration': 3.0,        # seconds
-            'save_frames': True
-        }
+        """Load simulation parameters (JSON or YAML, any accepted key spelling)"""
+        config = SimulationConfig.from_dict(self.config_keys(self.DEFAULT_PARAMS))
         
         if config_file:
             try:
-                with open(config_file, 'r') as f:
-                    custom_params = json.load(f)
-                    self.params.update(custom_params)
+                config = config.replace(**self.config_keys(read_config_file(config_file) or {}))
             except FileNotFoundError:
                 print(f"Config file {config_file} not found, using defaults")
+        
+        self.set_config(config)
+    
+    def set_config(self, config):
+        """Use ``config``; params is a read-only view so it always matches config.canonical_hash"""
+        self.config = config
+        self.params = MappingProxyType({self.PARAM_NAMES.get(name, name): value
+                                        for name, value in config.to_dict().items()})
     
     def setup_colormap(self):
         """Create custom colormap for tornado visualization"""
@@ -105,6 +134,25 @@ class TornadoSimulator:
         # Return real part for visualization
         return np.real(eta_complex)
     
+    def fourier_sum(self, R, THETA, z_level, t=0):
+        """
+        Sum of wave_function(R, THETA, z_level, t, m, k_n) / n over the Fourier modes.
+        Only k_n varies with n and z, t are scalars per layer, so the grid-wide
+        exponentials e^{imθ} and the radial decay are evaluated once and each
+        mode reduces to a complex scalar factor.
+        """
+        m = self.params['m_mode']
+        azimuthal = np.exp(-0.1 * R / self.params['a']) * np.exp(1j * m * THETA)
+        
+        coefficient = 0j
+        for n in range(1, self.params['n_fourier_modes'] + 1):
+            k_n = self.params['k_wave'] * n / 2
+            omega = self.wave_frequency(m, k_n)
+            amplitude = 1.0 / (1 + m + k_n)
+            coefficient += amplitude * np.exp(1j * (k_n * z_level - omega * t)) / n
+        
+        return np.real(coefficient * azimuthal)
+    
     def generate_fourier_layers(self, t=0):
         """Generate 3D tornado structure using Fourier series"""
         # Create coordinate grids
@@ -119,13 +167,7 @@ class TornadoSimulator:
             Z = np.full_like(R, z_level)
             
             # Calculate Fourier series sum
-            fourier_sum = np.zeros_like(R)
-            
-            for n in range(1, self.params['n_fourier_modes'] + 1):
-                k_n = self.params['k_wave'] * n / 2
-                wave_contrib = self.wave_function(R, THETA, Z, t, 
-                                                self.params['m_mode'], k_n)
-                fourier_sum += wave_contrib / n
+            fourier_sum = self.fourier_sum(R, THETA, z_level, t)
             
             # Apply height modulation
             Z_final = Z + fourier_sum * (1 + 0.1 * z_level)
@@ -235,34 +277,100 @@ class TornadoSimulator:
         
         plt.close()
     
-    def create_animation(self, output_path="tornado_animation.gif"):
-        """Create animated sequence"""
+    def time_points(self):
         n_frames = int(self.params['fps'] * self.params['duration'])
-        time_points = np.linspace(0, self.params['duration'], n_frames)
-        
-        frame_paths = []
+        return np.linspace(0, self.params['duration'], n_frames)
+    
+    def frame_path(self, i, frame_dir="."):
+        return os.path.join(frame_dir, f"temp_frame_{i:03d}.png")
+    
+    def render_frames(self, start, stop, frame_dir="."):
+        """Render frames [start, stop) of the animation as PNG files"""
+        time_points = self.time_points()
         
-        for i, t in enumerate(time_points):
-            print(f"Generating frame {i+1}/{n_frames} (t={t:.2f}s)")
+        for i in range(start, stop):
+            t = time_points[i]
+            print(f"Generating frame {i+1}/{len(time_points)} (t={t:.2f}s)")
             
             X_layers, Y_layers, Z_layers = self.generate_fourier_layers(t)
+            self.plot_3d_tornado(X_layers, Y_layers, Z_layers, t, self.frame_path(i, frame_dir))
+    
+    def render_frame_task(self, queue_dir, payload):
+        """Queue handler: render a frame range of any job with that job's own config"""
+        simulator = self.__class__(config=SimulationConfig(**payload['config']))
+        frame_dir = os.path.join(queue_dir, 'frames', payload['job'])
+        os.makedirs(frame_dir, exist_ok=True)
+        simulator.render_frames(payload['start'], payload['stop'], frame_dir)
+    
+    def save_gif(self, frame_paths, output_path):
+        from PIL import Image
+        images = [Image.open(path) for path in frame_paths]
+        images[0].save(output_path, format='GIF', save_all=True, append_images=images[1:],
+                       duration=1000//self.params['fps'], loop=0)
+    
+    def create_animation(self, output_path="tornado_animation.gif", queue_dir=None, chunk_size=10):
+        """Create animated sequence
+        
+        With ``queue_dir`` on a shared filesystem, frame ranges are rendered by
+        every process running this method on that directory, whatever its
+        parameters: each task carries the config of the job it belongs to. The
+        first process to build the GIF once all of its job's frames are done
+        publishes it.
+        """
+        n_frames = len(self.time_points())
+        
+        if queue_dir is None:
+            frame_dir = "."
+            self.render_frames(0, n_frames, frame_dir)
+        else:
+            queue = WorkQueue(queue_dir)
+            job = self.config.canonical_hash[:16]
+            frame_dir = os.path.join(queue_dir, 'frames', job)
+            config = self.config.to_dict()
             
-            frame_path = f"temp_frame_{i:03d}.png"
-            self.plot_3d_tornado(X_layers, Y_layers, Z_layers, t, frame_path)
-            frame_paths.append(frame_path)
+            task_ids = []
+            for start, stop in split_range(n_frames, chunk_size):
+                task_id = f"frames_{job}_{start:05d}_{stop:05d}"
+                payload = {'job': job, 'config': config, 'start': start, 'stop': stop}
+                queue.put(task_id, payload, retry_failed=True)
+                task_ids.append(task_id)
+            run_worker(queue, lambda payload: self.render_frame_task(queue_dir, payload), prefix='frames_')
+            
+            failed = [task_id for task_id in queue.failed_ids() if task_id in task_ids]
+            if failed:
+                print(f"{len(failed)} frame ranges failed, see {os.path.join(queue_dir, 'failed')}")
+                return
+            if not all(queue.is_done(task_id) for task_id in task_ids):
+                print("Frame ranges are still being rendered by other workers; not assembling")
+                return
+            if queue.was_claimed_once(f"frames_{job}_assemble"):
+                print(f"Animation for this configuration was already assembled from {queue_dir}")
+                return
+        
+        frame_paths = [self.frame_path(i, frame_dir) for i in range(n_frames)]
         
         # Create GIF (requires pillow)
         try:
-            from PIL import Image
-            images = []
-            for path in frame_paths:
-                images.append(Image.open(path))
-            
-            images[0].save(output_path, save_all=True, append_images=images[1:],
-                          duration=1000//self.params['fps'], loop=0)
+            if queue_dir is None:
+                self.save_gif(frame_paths, output_path)
+            else:
+                # Build into a private file and publish it only if this process
+                # is the first to succeed, so a failed attempt can be retried
+                tmp_path = f"{output_path}.{default_worker_id()}.tmp"
+                try:
+                    self.save_gif(frame_paths, tmp_path)
+                except OSError as error:
+                    print(f"Could not assemble animation: {error}")
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    return
+                if not queue.claim_once(f"frames_{job}_assemble"):
+                    os.remove(tmp_path)
+                    print(f"Animation for this configuration was already assembled from {queue_dir}")
+                    return
+                os.replace(tmp_path, output_path)
             
             # Cleanup temporary files
-            import os
             for path in frame_paths:
                 os.remove(path)
             
@@ -0,0 +1,94 @@
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from src.core.config import SimulationConfig
+from src.core.parameters import get_default_parameters, load_parameters_from_json, load_parameters_from_yaml
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'config')
+
+class TestSimulationConfig(unittest.TestCase):
+
+    def test_defaults(self):
+        config = SimulationConfig()
+        self.assertEqual(config.mode_m, 4)
+        self.assertEqual(config.output_format, ('png',))
+
+    def test_alias_spellings_share_hash(self):
+        a = SimulationConfig.from_dict({'modo_m': 3, 'layer_spacing': 3})
+        b = SimulationConfig.from_dict({'m_mode': 3.0, 'layer_spacing': 3.0})
+        self.assertEqual(a, b)
+        self.assertEqual(a.canonical_hash, b.canonical_hash)
+        self.assertEqual(len({a, b}), 1)
+
+    def test_hash_changes_with_values(self):
+        self.assertNotEqual(SimulationConfig().canonical_hash,
+                            SimulationConfig(mode_m=5).canonical_hash)
+
+    def test_immutable(self):
+        config = SimulationConfig()
+        with self.assertRaises(AttributeError):
+            config.mode_m = 2
+        with self.assertRaises(AttributeError):
+            config.extra = 1
+        self.assertEqual(config.replace(modo_m=2).mode_m, 2)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            SimulationConfig(mode_m=-1)
+        with self.assertRaises(ValueError):
+            SimulationConfig(n_layers=2.5)
+        with self.assertRaises(ValueError):
+            SimulationConfig(r_min=5, r_max=1)
+        with self.assertRaises(ValueError):
+            SimulationConfig.from_dict({'mode_mm': 4})
+        with self.assertRaises(ValueError):
+            SimulationConfig.from_dict({'mode_m': 4, 'modo_m': 5})
+        with self.assertRaises(ValueError):
+            SimulationConfig(output_format=5)
+        with self.assertRaises(ValueError):
+            SimulationConfig(output_format={'png': True})
+        with self.assertRaises(ValueError):
+            SimulationConfig(save_frames='yes')
+        for key in ('m', 'a'):
+            with self.assertRaises(ValueError):
+                SimulationConfig.from_dict({key: 2})
+
+    def test_load_files(self):
+        json_config = SimulationConfig.from_file(os.path.join(CONFIG_DIR, 'default_params.json'))
+        yaml_config = SimulationConfig.from_file(os.path.join(CONFIG_DIR, 'simulation_config.yaml'))
+        self.assertEqual(json_config.video_duration, 10.0)
+        self.assertEqual(yaml_config.animation_fps, 30)
+        self.assertEqual(yaml_config.output_format, ('gif', 'image', 'mp4'))
+
+    def test_parameter_loaders_are_canonical(self):
+        params = load_parameters_from_json(os.path.join(CONFIG_DIR, 'default_params.json'))
+        self.assertEqual(params, SimulationConfig.from_dict(params).to_dict())
+        self.assertEqual(get_default_parameters()['mode_m'], 4)
+
+    def test_parameter_loaders_keep_their_format(self):
+        with self.assertRaises(ValueError):
+            load_parameters_from_json(os.path.join(CONFIG_DIR, 'simulation_config.yaml'))
+        params = load_parameters_from_yaml(os.path.join(CONFIG_DIR, 'simulation_config.yaml'))
+        self.assertEqual(params['animation_fps'], 30)
+
+    def test_replace_resolves_sections_and_aliases(self):
+        config = SimulationConfig().replace(animation_settings={'fps': 12}, m_mode=2)
+        self.assertEqual((config.animation_fps, config.mode_m), (12, 2))
+
+    def test_pickle_roundtrip(self):
+        config = SimulationConfig(mode_m=6)
+        self.assertEqual(pickle.loads(pickle.dumps(config)), config)
+
+class TestInstalledLayout(unittest.TestCase):
+
+    def test_packages_importable_as_top_level(self):
+        # setup.py installs core/, utils/ and visualization/ as top-level packages
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = ("import core.parameters as p; import core.config; p.get_default_parameters(); "
+                "import core.vortex_generator; import visualization.animation")
+        subprocess.run([sys.executable, '-c', code], cwd=src_dir, check=True)
+
+if __name__ == '__main__':
+    unittest.main()
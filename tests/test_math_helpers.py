@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+from src.utils.math_helpers import harmonic_exponentials
+from src.visualization.animation import generate_fourier_modes
+
+class TestHarmonicExponentials(unittest.TestCase):
+
+    def setUp(self):
+        theta = np.linspace(0, 2 * np.pi, 60)
+        z = np.linspace(0, 10, 30)
+        THETA, Z = np.meshgrid(theta, z)
+        self.phase = 4 * THETA + 0.65 * Z - 0.3
+
+    def test_matches_direct_evaluation(self):
+        for n, harmonic in enumerate(harmonic_exponentials(self.phase, 40), start=1):
+            np.testing.assert_allclose(harmonic, np.exp(1j * n * self.phase), atol=1e-12)
+
+    def test_renormalized_to_unit_modulus(self):
+        harmonics = harmonic_exponentials(self.phase, 64, renormalize_every=8)
+        for n, harmonic in enumerate(harmonics, start=1):
+            if n % 8 == 0:
+                np.testing.assert_allclose(np.abs(harmonic), 1.0, atol=1e-15)
+
+    def test_tolerance_checked_mode(self):
+        list(harmonic_exponentials(self.phase, 32, renormalize_every=4, tol=1e-10))
+        with self.assertRaises(FloatingPointError):
+            list(harmonic_exponentials(self.phase, 32, renormalize_every=4, tol=0.0))
+
+    def test_short_series_is_checked(self):
+        with self.assertRaises(FloatingPointError):
+            list(harmonic_exponentials(self.phase, 4, tol=0.0))
+        list(harmonic_exponentials(self.phase, 4, tol=1e-12))
+
+    def test_check_interval_clamped_to_series_length(self):
+        with self.assertRaises(FloatingPointError):
+            list(harmonic_exponentials(0.3, 4, tol=0.0))
+        with self.assertRaises(FloatingPointError):
+            list(harmonic_exponentials(self.phase, 20, renormalize_every=32, tol=0.0))
+
+    def test_invalid_renormalize_every(self):
+        with self.assertRaises(ValueError):
+            next(harmonic_exponentials(self.phase, 4, renormalize_every=0))
+
+    def test_yields_independent_arrays(self):
+        harmonics = list(harmonic_exponentials(np.array([0.3]), 3))
+        np.testing.assert_allclose(np.concatenate(harmonics), np.exp(0.3j * np.arange(1, 4)))
+
+    def test_scalar_phase(self):
+        harmonics = [complex(h) for h in harmonic_exponentials(0.5, 3)]
+        np.testing.assert_allclose(harmonics, np.exp(1j * 0.5 * np.arange(1, 4)))
+
+class TestGenerateFourierModes(unittest.TestCase):
+
+    @staticmethod
+    def direct_sum(r, theta, z, t, m, k, n_fourier_modes):
+        # Per-mode evaluation that generate_fourier_modes replaces
+        fourier_sum = np.zeros_like(r)
+        for n in range(1, n_fourier_modes + 1):
+            amplitude_n = 1.0 / n**0.5
+            omega_n = 1.2 * (1 + 0.2 * n)
+            k_n = k * n / 2
+            fourier_sum += amplitude_n * np.cos(n * m * theta + k_n * z - omega_n * t)
+        return fourier_sum
+
+    def test_matches_direct_sum(self):
+        R, THETA = np.meshgrid(np.linspace(0.5, 10, 30), np.linspace(0, 2 * np.pi, 60))
+        Z = np.full_like(R, 5.0)
+        for n_fourier_modes in (4, 24):
+            for t in (0.0, 2.3):
+                expected = self.direct_sum(R, THETA, Z, t, 4, 1.3, n_fourier_modes)
+                result = generate_fourier_modes(R, THETA, Z, t, 4, 1.3, n_fourier_modes)
+                np.testing.assert_allclose(result, expected, atol=1e-12)
+                checked = generate_fourier_modes(R, THETA, Z, t, 4, 1.3, n_fourier_modes, tol=1e-12)
+                np.testing.assert_allclose(checked, expected, atol=1e-12)
+
+if __name__ == '__main__':
+    unittest.main()
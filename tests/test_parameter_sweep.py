@@ -0,0 +1,32 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from examples.parameter_sweep import parameter_sweep
+from src.utils.work_queue import WorkQueue
+
+class TestDistributedParameterSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    @mock.patch('examples.parameter_sweep.save_as_image')
+    @mock.patch('examples.parameter_sweep.plot_vortex_3d')
+    def test_sweep_drains_queue(self, plot_vortex_3d, save_as_image):
+        failed = parameter_sweep([2, 4], [1, 3], [0, 1], queue_dir=self.root, output_dir=self.root)
+        self.assertEqual(failed, [])
+        self.assertEqual(plot_vortex_3d.call_count, 8)
+        self.assertEqual(save_as_image.call_count, 8)
+        self.assertEqual(WorkQueue(self.root).counts()['done'], 8)
+
+    @mock.patch('examples.parameter_sweep.save_as_image', side_effect=OSError("disk full"))
+    @mock.patch('examples.parameter_sweep.plot_vortex_3d')
+    def test_failures_are_reported(self, plot_vortex_3d, save_as_image):
+        failed = parameter_sweep([2], [1], [0], queue_dir=self.root, output_dir=self.root)
+        self.assertEqual(failed, ['sweep_m2_k1_t0'])
+
+if __name__ == '__main__':
+    unittest.main()
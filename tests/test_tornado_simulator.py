@@ -0,0 +1,129 @@
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from PIL import Image
+from teste_tornado import TornadoSimulator
+from src.utils.work_queue import WorkQueue
+
+class FakeRenderSimulator(TornadoSimulator):
+    """Writes blank frames instead of plotting them."""
+
+    def render_frames(self, start, stop, frame_dir="."):
+        for i in range(start, stop):
+            Image.new('RGB', (4, 4)).save(self.frame_path(i, frame_dir))
+
+class FlakyAssemblySimulator(FakeRenderSimulator):
+    """Fails to build the GIF on the first attempt."""
+
+    attempts = 0
+
+    def save_gif(self, frame_paths, output_path):
+        FlakyAssemblySimulator.attempts += 1
+        if FlakyAssemblySimulator.attempts == 1:
+            raise OSError("disk full")
+        super().save_gif(frame_paths, output_path)
+
+def animate(m_mode, queue_dir, output_path):
+    simulator = FakeRenderSimulator(config=FakeRenderSimulator().config.replace(m_mode=m_mode, fps=4, duration=3.0))
+    simulator.create_animation(output_path, queue_dir=queue_dir, chunk_size=2)
+
+class TestTornadoConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def write_config(self, data):
+        path = os.path.join(self.root, 'config.json')
+        with open(path, 'w') as file:
+            json.dump(data, file)
+        return path
+
+    def test_defaults(self):
+        simulator = TornadoSimulator()
+        self.assertEqual(simulator.params['m_mode'], 4)
+        self.assertEqual(simulator.params['a'], 1.0)
+        self.assertEqual(simulator.params['fps'], 20)
+
+    def test_key_spellings_share_config(self):
+        a = TornadoSimulator(self.write_config({'modo_m': 3, 'animation_fps': 10}))
+        b = TornadoSimulator(self.write_config({'m_mode': 3, 'fps': 10}))
+        self.assertEqual(a.params['m_mode'], 3)
+        self.assertEqual(a.config.canonical_hash, b.config.canonical_hash)
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            TornadoSimulator(self.write_config({'m_mod': 3}))
+
+    def test_radius_spelled_a(self):
+        simulator = TornadoSimulator(self.write_config({'a': 2.0}))
+        self.assertEqual(simulator.config.core_radius, 2.0)
+        self.assertEqual(simulator.params['a'], 2.0)
+
+    def test_params_are_read_only(self):
+        simulator = TornadoSimulator()
+        with self.assertRaises(TypeError):
+            simulator.params['n_fourier_modes'] = 20
+
+    def test_queue_dir_reused_for_other_parameters(self):
+        queue_dir = os.path.join(self.root, 'queue')
+        for i, m_mode in enumerate((2, 3)):
+            simulator = FakeRenderSimulator(self.write_config({'m_mode': m_mode, 'fps': 2, 'duration': 2.0}))
+            output_path = os.path.join(self.root, f"anim_{i}.gif")
+            simulator.create_animation(output_path, queue_dir=queue_dir, chunk_size=3)
+            self.assertTrue(os.path.exists(output_path))
+
+    def test_concurrent_jobs_share_queue(self):
+        queue_dir = os.path.join(self.root, 'queue')
+        outputs = [os.path.join(self.root, f"anim_{m_mode}.gif") for m_mode in (2, 3)]
+        workers = [multiprocessing.Process(target=animate, args=(m_mode, queue_dir, output))
+                   for m_mode, output in zip((2, 3), outputs)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            self.assertEqual(worker.exitcode, 0)
+        for output in outputs:
+            self.assertTrue(os.path.exists(output))
+        self.assertEqual(os.listdir(os.path.join(queue_dir, 'failed')), [])
+
+    def test_other_task_kinds_left_alone(self):
+        queue_dir = os.path.join(self.root, 'queue')
+        queue = WorkQueue(queue_dir)
+        queue.put('sweep_m1_k1_t0', {'m': 1, 'k': 1, 't': 0})
+        output_path = os.path.join(self.root, 'anim.gif')
+        FakeRenderSimulator(self.write_config({'fps': 2, 'duration': 1.0})).create_animation(output_path, queue_dir=queue_dir)
+        self.assertTrue(os.path.exists(output_path))
+        self.assertEqual(queue.counts('sweep_')['pending'], 1)
+
+    def test_failed_assembly_can_be_retried(self):
+        queue_dir = os.path.join(self.root, 'queue')
+        output_path = os.path.join(self.root, 'anim.gif')
+        simulator = FlakyAssemblySimulator(self.write_config({'fps': 2, 'duration': 1.0}))
+        simulator.create_animation(output_path, queue_dir=queue_dir)
+        self.assertFalse(os.path.exists(output_path))
+        simulator.create_animation(output_path, queue_dir=queue_dir)
+        self.assertTrue(os.path.exists(output_path))
+
+class TestTornadoFourierSum(unittest.TestCase):
+
+    def test_matches_wave_function_sum(self):
+        R, THETA = np.meshgrid(np.linspace(0.5, 15, 20), np.linspace(0, 2 * np.pi, 40))
+        for n_fourier_modes in (6, 20):
+            simulator = TornadoSimulator(config=TornadoSimulator().config.replace(n_fourier_modes=n_fourier_modes))
+            for z_level, t in ((0.0, 0.0), (12.5, 1.7)):
+                expected = np.zeros_like(R)
+                for n in range(1, n_fourier_modes + 1):
+                    k_n = simulator.params['k_wave'] * n / 2
+                    Z = np.full_like(R, z_level)
+                    expected += simulator.wave_function(R, THETA, Z, t, simulator.params['m_mode'], k_n) / n
+                np.testing.assert_allclose(simulator.fourier_sum(R, THETA, z_level, t), expected, atol=1e-12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from src.core.vortex_generator import VortexGenerator
 
 class TestVortexGenerator(unittest.TestCase):
@@ -21,6 +22,14 @@ class TestVortexGenerator(unittest.TestCase):
         result = self.vortex_gen.compute_wave_function(m, k, t)
         self.assertIsNotNone(result)
 
+    def test_structure_matches_harmonic_sum(self):
+        r, theta = np.meshgrid(np.linspace(0.5, 10, 20), np.linspace(0, 2 * np.pi, 40))
+        z = np.full_like(r, 5.0)
+        for k in (3, 20):
+            vortex_gen = VortexGenerator(m=4, k=k, t=1.3)
+            expected = sum(vortex_gen.wave_function(r, theta, z, n) for n in range(1, k + 1))
+            np.testing.assert_allclose(vortex_gen.generate_vortex_structure(r, theta, z), expected, atol=1e-12)
+
     def test_parameter_validation(self):
         with self.assertRaises(ValueError):
             VortexGenerator(m=-1, k=1.0, t=0.0)
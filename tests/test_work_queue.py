@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from src.utils.work_queue import WorkQueue, run_worker, split_range
+
+def square_task(payload):
+    time.sleep(0.01)
+    return {'value': payload['x'] ** 2, 'pid': os.getpid()}
+
+def failing_task(payload):
+    raise RuntimeError("boom")
+
+def drain(root):
+    run_worker(WorkQueue(root), square_task, poll_interval=0.05)
+
+class TestWorkQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.queue = WorkQueue(self.root, lease_timeout=60.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_put_skips_known_tasks(self):
+        self.assertTrue(self.queue.put('a', {'x': 1}))
+        self.assertFalse(self.queue.put('a', {'x': 2}))
+        with self.assertRaises(ValueError):
+            self.queue.put('bad/id', {})
+
+    def test_claim_is_exclusive(self):
+        self.queue.put('a', {'x': 1})
+        task = self.queue.claim('w1')
+        self.assertEqual(task.payload, {'x': 1})
+        self.assertIsNone(self.queue.claim('w2'))
+        self.queue.complete(task, 1)
+        self.assertEqual(self.queue.results(), {'a': 1})
+        self.assertTrue(self.queue.is_drained())
+
+    def test_expired_lease_is_requeued(self):
+        self.queue.put('a', {'x': 3})
+        stale = self.queue.claim('dead-worker')
+        self.assertEqual(self.queue.requeue_expired(), 0)
+        self.assertEqual(self.queue.requeue_expired(now=time.time() + 120), 1)
+        self.assertFalse(self.queue.heartbeat(stale))
+
+        fresh = self.queue.claim('w2')
+        self.assertEqual(fresh.task_id, 'a')
+        self.queue.complete(fresh, 9)
+        self.assertEqual(self.queue.counts(), {'pending': 0, 'claimed': 0, 'done': 1, 'failed': 0})
+
+    def test_failures_are_recorded(self):
+        self.queue.put('a', {'x': 1})
+        self.assertEqual(run_worker(self.queue, failing_task), 1)
+        self.assertEqual(self.queue.counts()['failed'], 1)
+
+    def test_retry_failed(self):
+        self.queue.put('a', {'x': 2})
+        run_worker(self.queue, failing_task)
+        self.assertEqual(self.queue.failed_ids(), ['a'])
+        self.assertFalse(self.queue.put('a', {'x': 2}))
+        self.assertTrue(self.queue.put('a', {'x': 2}, retry_failed=True))
+        run_worker(self.queue, square_task)
+        self.assertEqual(self.queue.failed_ids(), [])
+        self.assertTrue(self.queue.is_done('a'))
+
+    def test_prefix_scopes_workers(self):
+        self.queue.put('sweep_a', {'x': 2})
+        self.queue.put('frames_a', {'start': 0})
+        self.assertEqual(run_worker(self.queue, square_task, prefix='sweep_'), 1)
+        self.assertTrue(self.queue.is_drained('sweep_'))
+        self.assertFalse(self.queue.is_drained())
+        self.assertEqual(self.queue.claim('w1', prefix='frames_').task_id, 'frames_a')
+
+    def test_claim_once(self):
+        self.assertFalse(self.queue.was_claimed_once('assemble'))
+        self.assertTrue(self.queue.claim_once('assemble'))
+        self.assertFalse(self.queue.claim_once('assemble'))
+        self.assertTrue(self.queue.was_claimed_once('assemble'))
+
+    def test_multiprocess_drain(self):
+        for x in range(40):
+            self.queue.put(f"task_{x:02d}", {'x': x})
+        workers = [multiprocessing.Process(target=drain, args=(self.root,)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            self.assertEqual(worker.exitcode, 0)
+
+        results = self.queue.results()
+        self.assertEqual({key: value['value'] for key, value in results.items()},
+                         {f"task_{x:02d}": x ** 2 for x in range(40)})
+        self.assertTrue(self.queue.is_drained())
+
+    def test_split_range(self):
+        self.assertEqual(split_range(7, 3), [(0, 3), (3, 6), (6, 7)])
+
+if __name__ == '__main__':
+    unittest.main()